@@ -74,6 +74,13 @@ struct FindAbsMaxFunctor<platform::CUDADeviceContext, T> {
 
 template struct FindAbsMaxFunctor<platform::CUDADeviceContext, float>;
 
+// A pack of four elements, loaded and stored as one 128-bit transaction
+// for float, shared by the vectorized channel-wise kernels below.
+template <typename T>
+struct alignas(sizeof(T) * 4) QuantVec4 {
+  T val[4];
+};
+
 template <typename T>
 __global__ void FindChannelAbsMaxKernelQuantAxis0(const T* in, const int n,
                                                   const int c, T* out) {
@@ -100,6 +107,43 @@ __global__ void FindChannelAbsMaxKernelQuantAxis0(const T* in, const int n,
   }
 }
 
+// Vectorized variant of FindChannelAbsMaxKernelQuantAxis0, used when the
+// channel slab size is a multiple of 4. Each thread keeps a private running
+// maximum over 128-bit loads and only then goes through shared memory, so a
+// channel's worth of weight data is read in a quarter of the requests.
+template <typename T>
+__global__ void FindChannelAbsMaxKernelQuantAxis0Vec4(const T* in, const int n,
+                                                      const int c, T* out) {
+  int tid = threadIdx.x;
+  int channel_size = n / c;
+  const QuantVec4<T>* in_c =
+      reinterpret_cast<const QuantVec4<T>*>(in + blockIdx.x * channel_size);
+  extern __shared__ T shared_max_data[];
+  T local_max = T(0);
+  int vec_size = channel_size / 4;
+  for (int i = tid; i < vec_size; i += blockDim.x) {
+    QuantVec4<T> v = in_c[i];
+#pragma unroll
+    for (int j = 0; j < 4; ++j) {
+      T tmp = fabs(v.val[j]);
+      if (tmp > local_max) {
+        local_max = tmp;
+      }
+    }
+  }
+  shared_max_data[tid] = local_max;
+  __syncthreads();
+  for (int i = blockDim.x / 2; i > 0; i >>= 1) {
+    if (tid < i && (shared_max_data[tid] < shared_max_data[tid + i])) {
+      shared_max_data[tid] = shared_max_data[tid + i];
+    }
+    __syncthreads();
+  }
+  if (tid == 0) {
+    out[blockIdx.x] = shared_max_data[0];
+  }
+}
+
 template <typename T>
 __global__ void FindChannelAbsMaxKernelQuantAxis1(const T* in, const int n,
                                                   const int cin, const int cout,
@@ -153,9 +197,15 @@ struct FindChannelAbsMaxFunctor<platform::CUDADeviceContext, T> {
       int cout = in_dims[0];
       int grid = cout;
       int block = 1024;
-      FindChannelAbsMaxKernelQuantAxis0<
-          T><<<grid, block, block * sizeof(T), ctx.stream()>>>(
-          in_data, num, cout, out_abs_max);
+      if ((num / cout) % 4 == 0) {
+        FindChannelAbsMaxKernelQuantAxis0Vec4<
+            T><<<grid, block, block * sizeof(T), ctx.stream()>>>(
+            in_data, num, cout, out_abs_max);
+      } else {
+        FindChannelAbsMaxKernelQuantAxis0<
+            T><<<grid, block, block * sizeof(T), ctx.stream()>>>(
+            in_data, num, cout, out_abs_max);
+      }
     } else if (quant_axis == 1) {
       int cin = in_dims[0];
       int cout = in_dims[1];
@@ -433,6 +483,42 @@ struct FindMovingAverageAbsMaxFunctor<platform::CUDADeviceContext, T> {
   }
 };
 
+template <typename T>
+__global__ void FindMovingAverageAbsMaxKernel(const T* in_accum,
+                                              const T* in_state,
+                                              const T* cur_scale, const T rate,
+                                              T* out_state, T* out_accum,
+                                              T* out_scale) {
+  T state = rate * in_state[0] + 1;
+  T accum = rate * in_accum[0] + cur_scale[0];
+  out_state[0] = state;
+  out_accum[0] = accum;
+  out_scale[0] = accum / state;
+}
+
+template <typename T>
+struct FindMovingAverageAbsMaxFusedFunctor<platform::CUDADeviceContext, T> {
+  void operator()(const platform::CUDADeviceContext& ctx,
+                  const framework::Tensor& in_accum,
+                  const framework::Tensor& in_state, const T* cur_scale,
+                  const float rate, framework::Tensor* out_state,
+                  framework::Tensor* out_accum, framework::Tensor* out_scale) {
+    const auto gpu_place = BOOST_GET_CONST(platform::CUDAPlace, ctx.GetPlace());
+
+    // The moving average update stays on the device, so the just-reduced
+    // abs_max feeds the state/accum/scale update without any cudaMemcpy or
+    // stream synchronization in between.
+    FindMovingAverageAbsMaxKernel<T><<<1, 1, 0, ctx.stream()>>>(
+        in_accum.data<T>(), in_state.data<T>(), cur_scale, static_cast<T>(rate),
+        out_state->mutable_data<T>(gpu_place),
+        out_accum->mutable_data<T>(gpu_place),
+        out_scale->mutable_data<T>(gpu_place));
+  }
+};
+
+template struct FindMovingAverageAbsMaxFusedFunctor<platform::CUDADeviceContext,
+                                                    float>;
+
 // ChannelClipAndQuantDequantKernel for quant_axis is 0
 template <typename T>
 __global__ void ChannelClipAndQuantDequantKernelQuantAxis0(
@@ -444,15 +530,51 @@ __global__ void ChannelClipAndQuantDequantKernelQuantAxis0(
   const T* in_c = in + blockIdx.x * channel_size;
   T* out_c = out + blockIdx.x * channel_size;
 
+  // The quantization is symmetric, so the whole quant-dequant pass boils
+  // down to two per-channel factors that are hoisted out of the loop.
   T s = scale[blockIdx.x];
-  T inv_s = inverse(s);
+  T quant_factor = bin_cnt * inverse(s);
+  T dequant_factor = s / bin_cnt;
 
   for (int i = tid; i < channel_size; i += blockDim.x) {
     T x = in_c[i];
     T v = x > s ? s : x;
     v = v < -s ? -s : v;
-    v = bin_cnt * inv_s * v;
-    out_c[i] = round(v) * s / bin_cnt;
+    out_c[i] = round(quant_factor * v) * dequant_factor;
+  }
+}
+
+// Vectorized variant of ChannelClipAndQuantDequantKernelQuantAxis0, used
+// when the channel slab size is a multiple of 4. Elements move in 128-bit
+// transactions and the per-channel scale factors are computed once per
+// block, with the scale fetched through the read-only cache.
+template <typename T>
+__global__ void ChannelClipAndQuantDequantKernelQuantAxis0Vec4(
+    const T* in, const T* scale, const int bin_cnt, const int n, const int c,
+    T* out) {
+  int channel_size = n / c;
+
+  T s = __ldg(&scale[blockIdx.x]);
+  T inv_s = inverse(s);
+  T quant_factor = bin_cnt * inv_s;
+  T dequant_factor = s / bin_cnt;
+
+  const QuantVec4<T>* in_c =
+      reinterpret_cast<const QuantVec4<T>*>(in + blockIdx.x * channel_size);
+  QuantVec4<T>* out_c =
+      reinterpret_cast<QuantVec4<T>*>(out + blockIdx.x * channel_size);
+
+  int vec_size = channel_size / 4;
+  for (int i = threadIdx.x; i < vec_size; i += blockDim.x) {
+    QuantVec4<T> v = in_c[i];
+#pragma unroll
+    for (int j = 0; j < 4; ++j) {
+      T x = v.val[j];
+      T t = x > s ? s : x;
+      t = t < -s ? -s : t;
+      v.val[j] = round(quant_factor * t) * dequant_factor;
+    }
+    out_c[i] = v;
   }
 }
 
@@ -462,7 +584,8 @@ __global__ void ChannelClipAndQuantDequantKernelQuantAxis1(
     const T* in, const T* scale, const int bin_cnt, const int n, const int cin,
     const int cout, T* out) {
   T s = scale[blockIdx.x % cout];
-  T inv_s = inverse(s);
+  T quant_factor = bin_cnt * inverse(s);
+  T dequant_factor = s / bin_cnt;
 
   int wh_size = n / (cin * cout);
   const T* in_c = in + blockIdx.x * wh_size;
@@ -472,8 +595,7 @@ __global__ void ChannelClipAndQuantDequantKernelQuantAxis1(
     T x = in_c[i];
     T v = x > s ? s : x;
     v = v < -s ? -s : v;
-    v = bin_cnt * inv_s * v;
-    out_c[i] = round(v) * s / bin_cnt;
+    out_c[i] = round(quant_factor * v) * dequant_factor;
   }
 }
 
@@ -501,9 +623,15 @@ struct ChannelClipFakeQuantDequantFunctor<platform::CUDADeviceContext, T> {
     if (quant_axis == 0) {
       int grid = in_dims[0];
       int block = 1024;
-      ChannelClipAndQuantDequantKernelQuantAxis0<
-          T><<<grid, block, 0, ctx.stream()>>>(in_data, scale_data, bin_cnt,
-                                               num, in_dims[0], out_data);
+      if ((num / in_dims[0]) % 4 == 0) {
+        ChannelClipAndQuantDequantKernelQuantAxis0Vec4<
+            T><<<grid, block, 0, ctx.stream()>>>(in_data, scale_data, bin_cnt,
+                                                 num, in_dims[0], out_data);
+      } else {
+        ChannelClipAndQuantDequantKernelQuantAxis0<
+            T><<<grid, block, 0, ctx.stream()>>>(in_data, scale_data, bin_cnt,
+                                                 num, in_dims[0], out_data);
+      }
     } else if (quant_axis == 1) {
       int grid = in_dims[0] * in_dims[1];
       int block = 1024;
@@ -539,6 +667,9 @@ REGISTER_OP_CUDA_KERNEL(moving_average_abs_max_scale,
 REGISTER_OP_CUDA_KERNEL(
     fake_quantize_dequantize_moving_average_abs_max,
     ops::FakeQuantizeDequantizeMovingAverageAbsMaxKernel<CUDA, float>);
+REGISTER_OP_CUDA_KERNEL(
+    fake_quantize_dequantize_moving_average_abs_max_fused,
+    ops::FakeQuantizeDequantizeMovingAverageAbsMaxFusedKernel<CUDA, float>);
 REGISTER_OP_CUDA_KERNEL(fake_quantize_dequantize_grad,
                         ops::FakeQuantDequantGradKernel<CUDA, float>);
 REGISTER_OP_CUDA_KERNEL(
@@ -88,6 +88,17 @@ struct FindMovingAverageAbsMaxFunctor {
                   framework::Tensor* out_scale);
 };
 
+// Does the same moving average update as FindMovingAverageAbsMaxFunctor, but
+// entirely on the device side, so the scalar state never round-trips through
+// the host between the abs_max reduction and the quant-dequant pass.
+template <typename DeviceContext, typename T>
+struct FindMovingAverageAbsMaxFusedFunctor {
+  void operator()(const DeviceContext& ctx, const framework::Tensor& in_accum,
+                  const framework::Tensor& in_state, const T* cur_scale,
+                  const float rate, framework::Tensor* out_state,
+                  framework::Tensor* out_accum, framework::Tensor* out_scale);
+};
+
 template <typename DeviceContext, typename T>
 class FakeAbsMaxKernelBase : public framework::OpKernel<T> {
  public:
@@ -307,6 +318,55 @@ class FakeQuantizeDequantizeMovingAverageAbsMaxKernel
   }
 };
 
+template <typename DeviceContext, typename T>
+class FakeQuantizeDequantizeMovingAverageAbsMaxFusedKernel
+    : public framework::OpKernel<T> {
+ public:
+  void Compute(const framework::ExecutionContext& context) const override {
+    auto* in = context.Input<framework::Tensor>("X");
+    auto* in_scale = context.Input<framework::Tensor>("InScale");
+    auto* out = context.Output<framework::Tensor>("Out");
+    out->mutable_data<T>(context.GetPlace());
+
+    bool is_test = context.Attr<bool>("is_test");
+    int bit_length = context.Attr<int>("bit_length");
+    int bin_cnt = std::pow(2, bit_length - 1) - 1;
+    auto& dev_ctx = context.template device_context<DeviceContext>();
+
+    // testing
+    if (is_test) {
+      ClipAndFakeQuantDequantFunctor<DeviceContext, T>()(dev_ctx, *in,
+                                                         *in_scale, bin_cnt,
+                                                         out);
+      return;
+    }
+
+    // training
+    auto* in_accum = context.Input<framework::Tensor>("InAccum");
+    auto* in_state = context.Input<framework::Tensor>("InState");
+    auto cur_scale = memory::Alloc(dev_ctx, sizeof(T));
+    T* cur_scale_data = static_cast<T*>(cur_scale->ptr());
+
+    FindAbsMaxFunctor<DeviceContext, T>()(dev_ctx, in->data<T>(), in->numel(),
+                                          cur_scale_data);
+
+    auto* out_state = context.Output<framework::Tensor>("OutState");
+    auto* out_accum = context.Output<framework::Tensor>("OutAccum");
+    auto* out_scale = context.Output<framework::Tensor>("OutScale");
+    out_state->mutable_data<T>(context.GetPlace());
+    out_accum->mutable_data<T>(context.GetPlace());
+    out_scale->mutable_data<T>(context.GetPlace());
+    float moving_rate = context.Attr<float>("moving_rate");
+
+    FindMovingAverageAbsMaxFusedFunctor<DeviceContext, T>()(
+        dev_ctx, *in_accum, *in_state, cur_scale_data, moving_rate, out_state,
+        out_accum, out_scale);
+
+    ClipAndFakeQuantDequantFunctor<DeviceContext, T>()(dev_ctx, *in, *out_scale,
+                                                       bin_cnt, out);
+  }
+};
+
 template <typename DeviceContext, typename T>
 class MovingAverageAbsMaxScaleKernel : public framework::OpKernel<T> {
  public:
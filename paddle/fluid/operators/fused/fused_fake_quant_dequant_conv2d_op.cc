@@ -0,0 +1,108 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License. */
+
+#include "paddle/fluid/operators/fused/fused_fake_quant_dequant_conv2d_op.h"
+#include <string>
+#include <vector>
+
+namespace paddle {
+namespace operators {
+
+// This fused op follows the equation:
+//   Output = conv2d(fake_qdq(Input, InScale), fake_qdq(Filter))
+// here, fake_qdq is the quantize-dequantize simulation used in QAT. The
+// activation is quantized with the running scale tracked by the Python
+// layer, the filter with a freshly computed abs_max scale. Fusing the two
+// fake_quantize_dequantize ops with the convolution saves two full-size
+// intermediate tensors and two dygraph op dispatches per layer.
+class FusedFakeQuantDequantConv2DOpMaker : public Conv2DOpMaker {
+ protected:
+  void Apply() override {
+    AddInput("InScale", "(Tensor) Current activation scale, shape is [1].");
+    AddAttr<int>("activation_bits",
+                 "(int, default 8), activation quantization bit number.")
+        .SetDefault(8)
+        .AddCustomChecker([](const int& bit_length) {
+          PADDLE_ENFORCE_EQ(bit_length >= 1 && bit_length <= 16, true,
+                            platform::errors::InvalidArgument(
+                                "'activation_bits' should be between 1 and "
+                                "16, but the received is %d",
+                                bit_length));
+        });
+    AddAttr<int>("weight_bits",
+                 "(int, default 8), weight quantization bit number.")
+        .SetDefault(8)
+        .AddCustomChecker([](const int& bit_length) {
+          PADDLE_ENFORCE_EQ(bit_length >= 1 && bit_length <= 16, true,
+                            platform::errors::InvalidArgument(
+                                "'weight_bits' should be between 1 and 16, "
+                                "but the received is %d",
+                                bit_length));
+        });
+    AddAttr<int>("weight_quant_axis",
+                 "(int, default -1) The axis for weight quantization. "
+                 "-1 means the whole filter shares one scale, 0 or 1 means "
+                 "channel wise quantization along that axis.")
+        .SetDefault(-1)
+        .AddCustomChecker([](const int& quant_axis) {
+          PADDLE_ENFORCE_EQ(
+              quant_axis == -1 || quant_axis == 0 || quant_axis == 1, true,
+              platform::errors::InvalidArgument(
+                  "'weight_quant_axis' should be -1, 0 or 1, but "
+                  "the received is %d",
+                  quant_axis));
+        });
+    AddAttr<bool>("use_int8_compute",
+                  "(bool, default false) Whether to run the convolution GEMM "
+                  "with INT8 tensor instructions on the GPU. Falls back to "
+                  "float computation when the configuration does not satisfy "
+                  "the INT8 GEMM requirements or on CPU.")
+        .SetDefault(false);
+  }
+};
+
+class FusedFakeQuantDequantConv2DOp : public operators::ConvOp {
+ public:
+  using operators::ConvOp::ConvOp;
+
+ protected:
+  void InferShape(framework::InferShapeContext* ctx) const override {
+    OP_INOUT_CHECK(ctx->HasInput("InScale"), "Input", "InScale",
+                   "FusedFakeQuantDequantConv2D");
+    std::vector<int64_t> output_shape = ComputeOutputShape(ctx);
+    ctx->SetOutputDim("Output", framework::make_ddim(output_shape));
+    ctx->ShareLoD("Input", "Output");
+  }
+
+  framework::OpKernelType GetExpectedKernelType(
+      const framework::ExecutionContext& ctx) const override {
+    return framework::OpKernelType(
+        OperatorWithKernel::IndicateVarDataType(ctx, "Input"), ctx.GetPlace());
+  }
+};
+
+}  // namespace operators
+}  // namespace paddle
+
+namespace ops = paddle::operators;
+using CPU = paddle::platform::CPUDeviceContext;
+
+REGISTER_OPERATOR(
+    fused_fake_quant_dequant_conv2d, ops::FusedFakeQuantDequantConv2DOp,
+    ops::FusedFakeQuantDequantConv2DOpMaker,
+    paddle::framework::EmptyGradOpMaker<paddle::framework::OpDesc>,
+    paddle::framework::EmptyGradOpMaker<paddle::imperative::OpBase>);
+REGISTER_OP_CPU_KERNEL(
+    fused_fake_quant_dequant_conv2d,
+    ops::FusedFakeQuantDequantConv2DKernel<CPU, float>);
@@ -0,0 +1,198 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License. */
+
+#include "paddle/fluid/operators/fused/fused_fake_quant_dequant_conv2d_op.h"
+#include "paddle/fluid/operators/fused/quant_int8_gemm.cu.h"
+
+namespace paddle {
+namespace operators {
+
+using CUDADeviceContext = platform::CUDADeviceContext;
+
+// GPU kernel with an opt-in real INT8 compute path. Instead of simulating
+// quantization in float, the im2col buffer and the filter are cast to INT8
+// and the GEMM runs with INT32 accumulation, rescaling the result back to
+// float. Unsupported configurations fall back to the generic float kernel.
+template <typename T>
+class FusedFakeQuantDequantConv2DCUDAKernel : public framework::OpKernel<T> {
+ public:
+  void Compute(const framework::ExecutionContext& context) const override {
+    int weight_quant_axis = context.Attr<int>("weight_quant_axis");
+    const Tensor* input = context.Input<Tensor>("Input");
+    const Tensor* filter = context.Input<Tensor>("Filter");
+
+    bool use_int8 = context.Attr<bool>("use_int8_compute") &&
+                    context.Attr<int>("activation_bits") == 8 &&
+                    context.Attr<int>("weight_bits") == 8 &&
+                    (weight_quant_axis == -1 || weight_quant_axis == 0) &&
+                    context.Attr<int>("groups") == 1 &&
+                    input->dims().size() == 4;
+    if (use_int8) {
+      Tensor* output = context.Output<Tensor>("Output");
+      const int64_t oc = filter->dims()[0];
+      const int64_t gemm_k = filter->numel() / oc;
+      const int64_t gemm_n =
+          output->numel() / (output->dims()[0] * output->dims()[1]);
+      use_int8 = Int8GemmShapeSupported(gemm_k, gemm_n);
+    }
+    if (!use_int8) {
+      FusedFakeQuantDequantConv2DKernel<CUDADeviceContext, T>().Compute(
+          context);
+      return;
+    }
+    ComputeInt8(context);
+  }
+
+ private:
+  void ComputeInt8(const framework::ExecutionContext& context) const {
+    const Tensor* input = context.Input<Tensor>("Input");
+    const Tensor* in_scale = context.Input<Tensor>("InScale");
+    Tensor filter = *context.Input<Tensor>("Filter");
+    Tensor* output = context.Output<Tensor>("Output");
+    output->mutable_data<T>(context.GetPlace());
+
+    const std::vector<int> strides = context.Attr<std::vector<int>>("strides");
+    std::vector<int> paddings = context.Attr<std::vector<int>>("paddings");
+    std::vector<int> dilations = context.Attr<std::vector<int>>("dilations");
+    const std::string padding_algorithm =
+        context.Attr<std::string>("padding_algorithm");
+    int weight_quant_axis = context.Attr<int>("weight_quant_axis");
+    const int bin_cnt = 127;
+
+    auto& dev_ctx = context.template device_context<CUDADeviceContext>();
+    auto stream = dev_ctx.stream();
+    const int block = 512;
+    auto grid_for = [&](int64_t num) {
+      return static_cast<int>((num + block - 1) / block);
+    };
+
+    auto in_dims = input->dims();
+    auto filter_dims = filter.dims();
+
+    framework::DDim in_data_dims =
+        framework::slice_ddim(in_dims, 2, in_dims.size());
+    framework::DDim filter_data_dims =
+        framework::slice_ddim(filter_dims, 2, filter_dims.size());
+
+    std::vector<int> ksize = framework::vectorize<int>(filter_data_dims);
+    UpdatePaddingAndDilation(&paddings, &dilations, padding_algorithm,
+                             in_data_dims, strides, ksize);
+
+    const int batch_size = static_cast<int>(in_dims[0]);
+    const int m = static_cast<int>(filter_dims[0]);
+    const int k = static_cast<int>(filter.numel() / filter_dims[0]);
+    const int n = static_cast<int>(output->numel() /
+                                   (output->dims()[0] * output->dims()[1]));
+
+    // The filter scale is computed fresh and the filter is quantized once,
+    // outside the batch loop. quant_axis 0 means one scale per output
+    // channel, i.e. per row of the [m, k] filter matrix.
+    int scale_num = weight_quant_axis == 0 ? m : 1;
+    Tensor wt_scales = context.AllocateTmpTensor<T, CUDADeviceContext>(
+        {scale_num}, dev_ctx);
+    if (weight_quant_axis == 0) {
+      FindChannelAbsMaxFunctor<CUDADeviceContext, T>()(dev_ctx, filter, 0,
+                                                       wt_scales.data<T>());
+    } else {
+      FindAbsMaxFunctor<CUDADeviceContext, T>()(
+          dev_ctx, filter.data<T>(), filter.numel(), wt_scales.data<T>());
+    }
+    int wt_inner = weight_quant_axis == 0 ? k : 1;
+    Tensor filter_int8 = context.AllocateTmpTensor<int8_t, CUDADeviceContext>(
+        filter.dims(), dev_ctx);
+    ChannelQuantizeToInt8Kernel<
+        T><<<grid_for(filter.numel()), block, 0, stream>>>(
+        filter.data<T>(), wt_scales.data<T>(), wt_inner, scale_num, bin_cnt,
+        filter.numel(), filter_int8.data<int8_t>());
+
+    std::vector<int64_t> filter_shape_vec(framework::vectorize(filter_dims));
+    std::vector<int64_t> output_shape_vec(
+        framework::vectorize(output->dims()));
+
+    size_t data_dim = filter_shape_vec.size() - 2;
+    std::vector<int64_t> col_shape_vec(1 + 2 * data_dim);
+    col_shape_vec[0] = in_dims[1];
+    for (size_t j = 0; j < data_dim; ++j) {
+      col_shape_vec[j + 1] = filter_shape_vec[j + 2];
+      col_shape_vec[j + 1 + data_dim] = output_shape_vec[j + 2];
+    }
+    framework::DDim col_shape(framework::make_ddim(col_shape_vec));
+    framework::DDim col_matrix_shape =
+        framework::flatten_to_2d(col_shape, data_dim);
+
+    bool is_expand = IsExpand(filter_shape_vec, strides, paddings, dilations);
+
+    Tensor col;
+    Tensor col_matrix;
+    if (is_expand) {
+      col = context.AllocateTmpTensor<T, CUDADeviceContext>(col_shape,
+                                                            dev_ctx);
+      col_matrix.ShareDataWith(col);
+      col_matrix.Resize(col_matrix_shape);
+    }
+
+    framework::DDim in_matrix_shape =
+        framework::slice_ddim(in_dims, 1, in_dims.size());
+
+    framework::DDim output_matrix_shape = {
+        output->dims()[1],
+        output->numel() / (output->dims()[0] * output->dims()[1])};
+
+    Tensor col_int8 = context.AllocateTmpTensor<int8_t, CUDADeviceContext>(
+        {static_cast<int64_t>(k), static_cast<int64_t>(n)}, dev_ctx);
+    Tensor out_int32 = context.AllocateTmpTensor<int32_t, CUDADeviceContext>(
+        {static_cast<int64_t>(m), static_cast<int64_t>(n)}, dev_ctx);
+
+    math::Im2ColFunctor<math::ColFormat::kCFO, CUDADeviceContext, T> im2col;
+
+    for (int i = 0; i < batch_size; i++) {
+      Tensor in_batch = input->Slice(i, i + 1).Resize(in_matrix_shape);
+      Tensor out_batch = output->Slice(i, i + 1).Resize(output_matrix_shape);
+
+      if (!is_expand) {
+        col.ShareDataWith(in_batch);
+        col_matrix.ShareDataWith(col);
+        col_matrix.Resize(col_matrix_shape);
+      } else {
+        im2col(dev_ctx, in_batch, dilations, strides,
+               std::vector<int>{paddings[0], paddings[2], paddings[1],
+                                paddings[3]},
+               &col);
+      }
+
+      int64_t col_numel = col_matrix.numel();
+      QuantizeToInt8Kernel<T><<<grid_for(col_numel), block, 0, stream>>>(
+          col_matrix.data<T>(), in_scale->data<T>(), bin_cnt, col_numel,
+          col_int8.data<int8_t>());
+
+      Int8GemmEx(dev_ctx, m, n, k, filter_int8.data<int8_t>(),
+                 col_int8.data<int8_t>(), out_int32.data<int32_t>());
+
+      // Per-row scales on the [m, n] output slice for quant_axis 0.
+      DequantizeInt32OutKernel<
+          T><<<grid_for(out_batch.numel()), block, 0, stream>>>(
+          out_int32.data<int32_t>(), in_scale->data<T>(), wt_scales.data<T>(),
+          weight_quant_axis == 0 ? n : 1, scale_num, bin_cnt, bin_cnt,
+          out_batch.numel(), out_batch.data<T>());
+    }
+  }
+};
+
+}  // namespace operators
+}  // namespace paddle
+
+namespace ops = paddle::operators;
+
+REGISTER_OP_CUDA_KERNEL(fused_fake_quant_dequant_conv2d,
+                        ops::FusedFakeQuantDequantConv2DCUDAKernel<float>);
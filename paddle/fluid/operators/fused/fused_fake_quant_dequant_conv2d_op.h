@@ -0,0 +1,192 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License. */
+
+#pragma once
+
+#include <string>
+#include <vector>
+#include "paddle/fluid/framework/op_registry.h"
+#include "paddle/fluid/operators/conv_op.h"
+#include "paddle/fluid/operators/fake_quantize_op.h"
+#include "paddle/fluid/operators/math/blas.h"
+#include "paddle/fluid/operators/math/im2col.h"
+#include "paddle/fluid/operators/math/vol2col.h"
+
+namespace paddle {
+namespace operators {
+
+using Tensor = framework::Tensor;
+
+// Quantize and dequantize the weight tensor with a freshly computed abs_max
+// scale. When quant_axis is -1 the scale is a single value, otherwise one
+// scale per slice along quant_axis.
+template <typename DeviceContext, typename T>
+inline void FakeQuantDequantWeight(const framework::ExecutionContext& ctx,
+                                   const DeviceContext& dev_ctx,
+                                   const Tensor& weight, const int bin_cnt,
+                                   const int quant_axis, Tensor* out) {
+  if (quant_axis == -1) {
+    Tensor scale = ctx.AllocateTmpTensor<T, DeviceContext>({1}, dev_ctx);
+    FindAbsMaxFunctor<DeviceContext, T>()(dev_ctx, weight.data<T>(),
+                                          weight.numel(), scale.data<T>());
+    ClipAndFakeQuantDequantFunctor<DeviceContext, T>()(dev_ctx, weight, scale,
+                                                       bin_cnt, out);
+  } else {
+    Tensor scale = ctx.AllocateTmpTensor<T, DeviceContext>(
+        {weight.dims()[quant_axis]}, dev_ctx);
+    FindChannelAbsMaxFunctor<DeviceContext, T>()(dev_ctx, weight, quant_axis,
+                                                 scale.data<T>());
+    ChannelClipFakeQuantDequantFunctor<DeviceContext, T>()(
+        dev_ctx, weight, scale, bin_cnt, quant_axis, out);
+  }
+}
+
+template <typename DeviceContext, typename T>
+class FusedFakeQuantDequantConv2DKernel : public framework::OpKernel<T> {
+ public:
+  void Compute(const framework::ExecutionContext& context) const override {
+    const Tensor* input = context.Input<Tensor>("Input");
+    const Tensor* in_scale = context.Input<Tensor>("InScale");
+    Tensor filter = *context.Input<Tensor>("Filter");
+    Tensor* output = context.Output<Tensor>("Output");
+    output->mutable_data<T>(context.GetPlace());
+
+    const std::string data_format = context.Attr<std::string>("data_format");
+    PADDLE_ENFORCE_NE(
+        data_format, "NHWC",
+        platform::errors::PermissionDenied(
+            "Operator(FusedFakeQuantDequantConv2D) only supports data format "
+            "of channel first (NCHW) now. But recieved: data_format = '%s'.",
+            data_format));
+
+    const int groups = context.Attr<int>("groups");
+    const std::vector<int> strides = context.Attr<std::vector<int>>("strides");
+    std::vector<int> paddings = context.Attr<std::vector<int>>("paddings");
+    std::vector<int> dilations = context.Attr<std::vector<int>>("dilations");
+    const std::string padding_algorithm =
+        context.Attr<std::string>("padding_algorithm");
+
+    int activation_bits = context.Attr<int>("activation_bits");
+    int weight_bits = context.Attr<int>("weight_bits");
+    int weight_quant_axis = context.Attr<int>("weight_quant_axis");
+    int act_bin_cnt = std::pow(2, activation_bits - 1) - 1;
+    int weight_bin_cnt = std::pow(2, weight_bits - 1) - 1;
+
+    auto& dev_ctx = context.template device_context<DeviceContext>();
+
+    // quantize-dequantize the input with the running activation scale and
+    // the filter with a freshly computed abs_max scale, without going back
+    // to two standalone fake_quantize_dequantize ops.
+    Tensor quant_input =
+        context.AllocateTmpTensor<T, DeviceContext>(input->dims(), dev_ctx);
+    ClipAndFakeQuantDequantFunctor<DeviceContext, T>()(
+        dev_ctx, *input, *in_scale, act_bin_cnt, &quant_input);
+
+    Tensor quant_filter =
+        context.AllocateTmpTensor<T, DeviceContext>(filter.dims(), dev_ctx);
+    FakeQuantDequantWeight<DeviceContext, T>(context, dev_ctx, filter,
+                                             weight_bin_cnt, weight_quant_axis,
+                                             &quant_filter);
+
+    // convolution operator: im2col(or vol2col) + gemm, the same computation
+    // as GemmConvKernel but reading the quantized-dequantized tensors.
+    auto in_dims = quant_input.dims();
+    auto filter_dims = quant_filter.dims();
+
+    framework::DDim in_data_dims =
+        framework::slice_ddim(in_dims, 2, in_dims.size());
+    framework::DDim filter_data_dims =
+        framework::slice_ddim(filter_dims, 2, filter_dims.size());
+
+    std::vector<int> ksize = framework::vectorize<int>(filter_data_dims);
+    UpdatePaddingAndDilation(&paddings, &dilations, padding_algorithm,
+                             in_data_dims, strides, ksize);
+
+    const int batch_size = static_cast<int>(in_dims[0]);
+
+    std::vector<int64_t> filter_shape_vec(framework::vectorize(filter_dims));
+    std::vector<int64_t> output_shape_vec(
+        framework::vectorize(output->dims()));
+
+    size_t data_dim = filter_shape_vec.size() - 2;
+    std::vector<int64_t> col_shape_vec(1 + 2 * data_dim);
+    col_shape_vec[0] = in_dims[1] / groups;
+    for (size_t j = 0; j < data_dim; ++j) {
+      col_shape_vec[j + 1] = filter_shape_vec[j + 2];
+      col_shape_vec[j + 1 + data_dim] = output_shape_vec[j + 2];
+    }
+    framework::DDim col_shape(framework::make_ddim(col_shape_vec));
+    framework::DDim col_matrix_shape =
+        framework::flatten_to_2d(col_shape, data_dim);
+
+    bool is_expand = IsExpand(filter_shape_vec, strides, paddings, dilations);
+
+    Tensor col;
+    Tensor col_matrix;
+    if (is_expand) {
+      col = context.AllocateTmpTensor<T, DeviceContext>(col_shape, dev_ctx);
+      col_matrix.ShareDataWith(col);
+      col_matrix.Resize(col_matrix_shape);
+    }
+
+    framework::DDim in_matrix_shape =
+        framework::slice_ddim(in_dims, 1, in_dims.size());
+
+    framework::DDim filter_matrix_shape = {
+        filter_dims[0], quant_filter.numel() / filter_dims[0]};
+    quant_filter.Resize(filter_matrix_shape);
+
+    framework::DDim output_matrix_shape = {
+        output->dims()[1],
+        output->numel() / (output->dims()[0] * output->dims()[1])};
+
+    int in_step = static_cast<int>(in_dims[1]) / groups;
+    int out_step = static_cast<int>(output->dims()[1]) / groups;
+
+    math::Vol2ColFunctor<DeviceContext, T> vol2col;
+    math::Im2ColFunctor<math::ColFormat::kCFO, DeviceContext, T> im2col;
+
+    auto blas = math::GetBlas<DeviceContext, T>(dev_ctx);
+    for (int i = 0; i < batch_size; i++) {
+      Tensor in_batch = quant_input.Slice(i, i + 1).Resize(in_matrix_shape);
+      Tensor out_batch = output->Slice(i, i + 1).Resize(output_matrix_shape);
+
+      for (int g = 0; g < groups; g++) {
+        Tensor in_slice = in_batch.Slice(g * in_step, (g + 1) * in_step);
+
+        if (!is_expand) {
+          col.ShareDataWith(in_slice);
+          col_matrix.ShareDataWith(col);
+          col_matrix.Resize(col_matrix_shape);
+        } else if (data_dim == 2U) {
+          im2col(dev_ctx, in_slice, dilations, strides,
+                 std::vector<int>{paddings[0], paddings[2], paddings[1],
+                                  paddings[3]},
+                 &col);
+        } else if (data_dim == 3U) {
+          vol2col(dev_ctx, in_slice, dilations, strides, paddings, &col);
+        }
+
+        Tensor out_slice = out_batch.Slice(g * out_step, (g + 1) * out_step);
+        Tensor filter_slice =
+            quant_filter.Slice(g * out_step, (g + 1) * out_step);
+        blas.MatMul(filter_slice, false, col_matrix, false, T(1.0), &out_slice,
+                    T(0.0));
+      }
+    }
+  }
+};
+
+}  // namespace operators
+}  // namespace paddle
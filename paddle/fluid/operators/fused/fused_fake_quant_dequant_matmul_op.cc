@@ -0,0 +1,145 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License. */
+
+#include "paddle/fluid/operators/fused/fused_fake_quant_dequant_matmul_op.h"
+#include <vector>
+
+namespace paddle {
+namespace operators {
+
+class FusedFakeQuantDequantMatmulOp : public framework::OperatorWithKernel {
+ public:
+  using framework::OperatorWithKernel::OperatorWithKernel;
+
+  void InferShape(framework::InferShapeContext* ctx) const override {
+    OP_INOUT_CHECK(ctx->HasInput("X"), "Input", "X",
+                   "FusedFakeQuantDequantMatmul");
+    OP_INOUT_CHECK(ctx->HasInput("Y"), "Input", "Y",
+                   "FusedFakeQuantDequantMatmul");
+    OP_INOUT_CHECK(ctx->HasInput("InScale"), "Input", "InScale",
+                   "FusedFakeQuantDequantMatmul");
+    OP_INOUT_CHECK(ctx->HasOutput("Out"), "Output", "Out",
+                   "FusedFakeQuantDequantMatmul");
+
+    auto x_dims = ctx->GetInputDim("X");
+    auto y_dims = ctx->GetInputDim("Y");
+    PADDLE_ENFORCE_EQ(y_dims.size(), 2,
+                      platform::errors::InvalidArgument(
+                          "The input Y(weight) of "
+                          "Operator(FusedFakeQuantDequantMatmul) is expected "
+                          "to be a 2-D tensor. But received: Y's dimension = "
+                          "%u, shape = [%s].",
+                          y_dims.size(), y_dims));
+
+    int64_t x_last_dim = x_dims[x_dims.size() - 1];
+    if (ctx->IsRuntime() || (x_last_dim > 0 && y_dims[0] > 0)) {
+      PADDLE_ENFORCE_EQ(
+          x_last_dim, y_dims[0],
+          platform::errors::InvalidArgument(
+              "The last dimension of the input X of "
+              "Operator(FusedFakeQuantDequantMatmul) must equal the first "
+              "dimension of the input Y(weight). But received: X's shape = "
+              "[%s], Y's shape = [%s].",
+              x_dims, y_dims));
+    }
+
+    auto out_dims = framework::vectorize(x_dims);
+    out_dims[out_dims.size() - 1] = y_dims[1];
+    ctx->SetOutputDim("Out", framework::make_ddim(out_dims));
+    ctx->ShareLoD("X", /*->*/ "Out");
+  }
+
+ protected:
+  framework::OpKernelType GetExpectedKernelType(
+      const framework::ExecutionContext& ctx) const override {
+    return framework::OpKernelType(
+        OperatorWithKernel::IndicateVarDataType(ctx, "X"), ctx.GetPlace());
+  }
+};
+
+class FusedFakeQuantDequantMatmulOpMaker
+    : public framework::OpProtoAndCheckerMaker {
+ public:
+  void Make() override {
+    AddInput("X", "(Tensor) Input is float data type.");
+    AddInput("Y", "(Tensor) The 2-D weight tensor.");
+    AddInput("InScale", "(Tensor) Current activation scale, shape is [1].");
+    AddOutput("Out", "(Tensor) Output of the fused matmul.");
+    AddAttr<int>("activation_bits",
+                 "(int, default 8), activation quantization bit number.")
+        .SetDefault(8)
+        .AddCustomChecker([](const int& bit_length) {
+          PADDLE_ENFORCE_EQ(bit_length >= 1 && bit_length <= 16, true,
+                            platform::errors::InvalidArgument(
+                                "'activation_bits' should be between 1 and "
+                                "16, but the received is %d",
+                                bit_length));
+        });
+    AddAttr<int>("weight_bits",
+                 "(int, default 8), weight quantization bit number.")
+        .SetDefault(8)
+        .AddCustomChecker([](const int& bit_length) {
+          PADDLE_ENFORCE_EQ(bit_length >= 1 && bit_length <= 16, true,
+                            platform::errors::InvalidArgument(
+                                "'weight_bits' should be between 1 and 16, "
+                                "but the received is %d",
+                                bit_length));
+        });
+    AddAttr<int>("weight_quant_axis",
+                 "(int, default -1) The axis for weight quantization. "
+                 "-1 means the whole weight shares one scale, 0 or 1 means "
+                 "channel wise quantization along that axis.")
+        .SetDefault(-1)
+        .AddCustomChecker([](const int& quant_axis) {
+          PADDLE_ENFORCE_EQ(
+              quant_axis == -1 || quant_axis == 0 || quant_axis == 1, true,
+              platform::errors::InvalidArgument(
+                  "'weight_quant_axis' should be -1, 0 or 1, but "
+                  "the received is %d",
+                  quant_axis));
+        });
+    AddAttr<bool>("use_int8_compute",
+                  "(bool, default false) Whether to run the matmul with INT8 "
+                  "tensor instructions on the GPU. Falls back to float "
+                  "computation when the configuration does not satisfy the "
+                  "INT8 GEMM requirements or on CPU.")
+        .SetDefault(false);
+    AddComment(R"DOC(
+FusedFakeQuantDequantMatmul operator does the quantize-dequantize simulation
+of the input and the weight and then the matmul in one op:
+
+$$Out = fake\_qdq(X, InScale) * fake\_qdq(Y)$$
+
+The activation is quantized with the running scale tracked by the Python
+layer, the weight with a freshly computed abs_max scale. Fusing the two
+fake_quantize_dequantize ops with the matmul saves two full-size intermediate
+tensors and two dygraph op dispatches per layer.
+)DOC");
+  }
+};
+
+}  // namespace operators
+}  // namespace paddle
+
+namespace ops = paddle::operators;
+using CPU = paddle::platform::CPUDeviceContext;
+
+REGISTER_OPERATOR(
+    fused_fake_quant_dequant_matmul, ops::FusedFakeQuantDequantMatmulOp,
+    ops::FusedFakeQuantDequantMatmulOpMaker,
+    paddle::framework::EmptyGradOpMaker<paddle::framework::OpDesc>,
+    paddle::framework::EmptyGradOpMaker<paddle::imperative::OpBase>);
+REGISTER_OP_CPU_KERNEL(
+    fused_fake_quant_dequant_matmul,
+    ops::FusedFakeQuantDequantMatmulKernel<CPU, float>);
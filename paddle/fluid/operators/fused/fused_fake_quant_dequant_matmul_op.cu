@@ -0,0 +1,105 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License. */
+
+#include "paddle/fluid/operators/fused/fused_fake_quant_dequant_matmul_op.h"
+#include "paddle/fluid/operators/fused/quant_int8_gemm.cu.h"
+
+namespace paddle {
+namespace operators {
+
+using CUDADeviceContext = platform::CUDADeviceContext;
+
+// GPU kernel with an opt-in real INT8 compute path. Instead of simulating
+// quantization in float, it casts the already representable values to INT8
+// and runs the GEMM with INT32 accumulation, rescaling the result back to
+// float. Unsupported configurations fall back to the generic float kernel.
+template <typename T>
+class FusedFakeQuantDequantMatmulCUDAKernel : public framework::OpKernel<T> {
+ public:
+  void Compute(const framework::ExecutionContext& context) const override {
+    const Tensor* y = context.Input<Tensor>("Y");
+    const int64_t k = y->dims()[0];
+    const int64_t n = y->dims()[1];
+    int weight_quant_axis = context.Attr<int>("weight_quant_axis");
+
+    bool use_int8 = context.Attr<bool>("use_int8_compute") &&
+                    context.Attr<int>("activation_bits") == 8 &&
+                    context.Attr<int>("weight_bits") == 8 &&
+                    (weight_quant_axis == -1 || weight_quant_axis == 1) &&
+                    Int8GemmShapeSupported(k, n);
+    if (!use_int8) {
+      FusedFakeQuantDequantMatmulKernel<CUDADeviceContext, T>().Compute(
+          context);
+      return;
+    }
+
+    const Tensor* x = context.Input<Tensor>("X");
+    const Tensor* in_scale = context.Input<Tensor>("InScale");
+    Tensor* out = context.Output<Tensor>("Out");
+    T* out_data = out->mutable_data<T>(context.GetPlace());
+
+    const int bin_cnt = 127;
+    const int64_t m = x->numel() / k;
+
+    auto& dev_ctx = context.template device_context<CUDADeviceContext>();
+    auto stream = dev_ctx.stream();
+    const int block = 512;
+    auto grid_for = [&](int64_t num) {
+      return static_cast<int>((num + block - 1) / block);
+    };
+
+    // The weight scale is computed fresh, same as in the float path.
+    int scale_num = weight_quant_axis == 1 ? static_cast<int>(n) : 1;
+    Tensor wt_scales = context.AllocateTmpTensor<T, CUDADeviceContext>(
+        {scale_num}, dev_ctx);
+    if (weight_quant_axis == 1) {
+      FindChannelAbsMaxFunctor<CUDADeviceContext, T>()(dev_ctx, *y, 1,
+                                                       wt_scales.data<T>());
+    } else {
+      FindAbsMaxFunctor<CUDADeviceContext, T>()(dev_ctx, y->data<T>(),
+                                                y->numel(), wt_scales.data<T>());
+    }
+
+    Tensor x_int8 = context.AllocateTmpTensor<int8_t, CUDADeviceContext>(
+        x->dims(), dev_ctx);
+    QuantizeToInt8Kernel<T><<<grid_for(x->numel()), block, 0, stream>>>(
+        x->data<T>(), in_scale->data<T>(), bin_cnt, x->numel(),
+        x_int8.data<int8_t>());
+
+    Tensor y_int8 = context.AllocateTmpTensor<int8_t, CUDADeviceContext>(
+        y->dims(), dev_ctx);
+    // Per-column scales for quant_axis 1, i.e. inner size 1.
+    ChannelQuantizeToInt8Kernel<T><<<grid_for(y->numel()), block, 0, stream>>>(
+        y->data<T>(), wt_scales.data<T>(), 1, scale_num, bin_cnt, y->numel(),
+        y_int8.data<int8_t>());
+
+    Tensor out_int32 = context.AllocateTmpTensor<int32_t, CUDADeviceContext>(
+        {m, n}, dev_ctx);
+    Int8GemmEx(dev_ctx, static_cast<int>(m), static_cast<int>(n),
+               static_cast<int>(k), x_int8.data<int8_t>(),
+               y_int8.data<int8_t>(), out_int32.data<int32_t>());
+
+    DequantizeInt32OutKernel<T><<<grid_for(out->numel()), block, 0, stream>>>(
+        out_int32.data<int32_t>(), in_scale->data<T>(), wt_scales.data<T>(), 1,
+        scale_num, bin_cnt, bin_cnt, out->numel(), out_data);
+  }
+};
+
+}  // namespace operators
+}  // namespace paddle
+
+namespace ops = paddle::operators;
+
+REGISTER_OP_CUDA_KERNEL(fused_fake_quant_dequant_matmul,
+                        ops::FusedFakeQuantDequantMatmulCUDAKernel<float>);
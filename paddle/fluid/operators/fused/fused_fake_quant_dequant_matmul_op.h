@@ -0,0 +1,66 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License. */
+
+#pragma once
+
+#include "paddle/fluid/framework/op_registry.h"
+#include "paddle/fluid/operators/fused/fused_fake_quant_dequant_conv2d_op.h"
+#include "paddle/fluid/operators/math/blas.h"
+
+namespace paddle {
+namespace operators {
+
+template <typename DeviceContext, typename T>
+class FusedFakeQuantDequantMatmulKernel : public framework::OpKernel<T> {
+ public:
+  void Compute(const framework::ExecutionContext& context) const override {
+    const Tensor* x = context.Input<Tensor>("X");
+    const Tensor* y = context.Input<Tensor>("Y");
+    const Tensor* in_scale = context.Input<Tensor>("InScale");
+    Tensor* out = context.Output<Tensor>("Out");
+    out->mutable_data<T>(context.GetPlace());
+
+    int activation_bits = context.Attr<int>("activation_bits");
+    int weight_bits = context.Attr<int>("weight_bits");
+    int weight_quant_axis = context.Attr<int>("weight_quant_axis");
+    int act_bin_cnt = std::pow(2, activation_bits - 1) - 1;
+    int weight_bin_cnt = std::pow(2, weight_bits - 1) - 1;
+
+    auto& dev_ctx = context.template device_context<DeviceContext>();
+
+    Tensor quant_x =
+        context.AllocateTmpTensor<T, DeviceContext>(x->dims(), dev_ctx);
+    ClipAndFakeQuantDequantFunctor<DeviceContext, T>()(
+        dev_ctx, *x, *in_scale, act_bin_cnt, &quant_x);
+
+    Tensor quant_y =
+        context.AllocateTmpTensor<T, DeviceContext>(y->dims(), dev_ctx);
+    FakeQuantDequantWeight<DeviceContext, T>(context, dev_ctx, *y,
+                                             weight_bin_cnt, weight_quant_axis,
+                                             &quant_y);
+
+    // matmul over the 2-D views: X is flattened to [M, K], Y is [K, N].
+    const int64_t k = y->dims()[0];
+    const int64_t m = x->numel() / k;
+    quant_x.Resize({m, k});
+    Tensor out_matrix = *out;
+    out_matrix.Resize({m, y->dims()[1]});
+
+    auto blas = math::GetBlas<DeviceContext, T>(dev_ctx);
+    blas.MatMul(quant_x, false, quant_y, false, T(1.0), &out_matrix, T(0.0));
+  }
+};
+
+}  // namespace operators
+}  // namespace paddle
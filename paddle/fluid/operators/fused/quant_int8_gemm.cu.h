@@ -0,0 +1,112 @@
+/* Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License. */
+
+#pragma once
+
+#include <cuda.h>
+#include "paddle/fluid/platform/device_context.h"
+#include "paddle/fluid/platform/dynload/cublas.h"
+#include "paddle/fluid/platform/enforce.h"
+
+namespace paddle {
+namespace operators {
+
+// The INT8 cuBLAS GEMM requires the leading dimensions of both operands to
+// be multiples of four. Callers fall back to the float path when the shape
+// does not qualify.
+inline bool Int8GemmShapeSupported(int64_t k, int64_t n) {
+  return k % 4 == 0 && n % 4 == 0;
+}
+
+// Quantize a float tensor to INT8 with a single scale living on the device.
+// The values are assumed to have been produced by the matching fake quant
+// pass, so round-to-nearest recovers the integer grid exactly.
+template <typename T>
+__global__ void QuantizeToInt8Kernel(const T* in, const T* scale, int bin_cnt,
+                                     int num, int8_t* out) {
+  T factor = static_cast<T>(bin_cnt) / scale[0];
+  for (int i = blockIdx.x * blockDim.x + threadIdx.x; i < num;
+       i += blockDim.x * gridDim.x) {
+    T v = in[i] * factor;
+    v = v > static_cast<T>(bin_cnt) ? static_cast<T>(bin_cnt) : v;
+    v = v < static_cast<T>(-bin_cnt) ? static_cast<T>(-bin_cnt) : v;
+    out[i] = static_cast<int8_t>(roundf(v));
+  }
+}
+
+// Channel wise variant. For a row-major matrix the scale of element i is
+// scales[(i / inner) % scale_num]: inner is the row size for per-row scales
+// and 1 for per-column scales.
+template <typename T>
+__global__ void ChannelQuantizeToInt8Kernel(const T* in, const T* scales,
+                                            int inner, int scale_num,
+                                            int bin_cnt, int num,
+                                            int8_t* out) {
+  for (int i = blockIdx.x * blockDim.x + threadIdx.x; i < num;
+       i += blockDim.x * gridDim.x) {
+    T factor = static_cast<T>(bin_cnt) / scales[(i / inner) % scale_num];
+    T v = in[i] * factor;
+    v = v > static_cast<T>(bin_cnt) ? static_cast<T>(bin_cnt) : v;
+    v = v < static_cast<T>(-bin_cnt) ? static_cast<T>(-bin_cnt) : v;
+    out[i] = static_cast<int8_t>(roundf(v));
+  }
+}
+
+// Rescale the INT32 accumulators of an INT8 GEMM back to float. act_scale
+// is a device pointer to the activation scale, wt_scales holds scale_num
+// weight scales indexed the same way as in ChannelQuantizeToInt8Kernel.
+template <typename T>
+__global__ void DequantizeInt32OutKernel(const int32_t* in, const T* act_scale,
+                                         const T* wt_scales, int inner,
+                                         int scale_num, int act_bin_cnt,
+                                         int wt_bin_cnt, int num, T* out) {
+  T act_factor = act_scale[0] / static_cast<T>(act_bin_cnt);
+  for (int i = blockIdx.x * blockDim.x + threadIdx.x; i < num;
+       i += blockDim.x * gridDim.x) {
+    T wt_factor =
+        wt_scales[(i / inner) % scale_num] / static_cast<T>(wt_bin_cnt);
+    out[i] = static_cast<T>(in[i]) * act_factor * wt_factor;
+  }
+}
+
+// Row-major [m, k] x [k, n] INT8 GEMM with INT32 accumulation, issued as the
+// column-major product of the swapped operands like the float GEMM wrappers
+// in math/blas_impl.cu.h. Uses dp4a on sm_61+ and the IMMA tensor cores
+// where cuBLAS selects them.
+inline void Int8GemmEx(const platform::CUDADeviceContext& dev_ctx, int m,
+                       int n, int k, const int8_t* a, const int8_t* b,
+                       int32_t* c) {
+#if CUDA_VERSION >= 8000
+  int32_t alpha = 1;
+  int32_t beta = 0;
+  cublasGemmAlgo_t algo = CUBLAS_GEMM_DFALT;
+#if CUDA_VERSION >= 9000
+  if (dev_ctx.tensor_core_available()) {
+    algo = CUBLAS_GEMM_DFALT_TENSOR_OP;
+  }
+#endif  // CUDA_VERSION >= 9000
+  auto& cuda_ctx = const_cast<platform::CUDADeviceContext&>(dev_ctx);
+  cuda_ctx.TensorCoreCublasCallIfAvailable([&](cublasHandle_t handle) {
+    PADDLE_ENFORCE_CUDA_SUCCESS(platform::dynload::cublasGemmEx(
+        handle, CUBLAS_OP_N, CUBLAS_OP_N, n, m, k, &alpha, b, CUDA_R_8I, n, a,
+        CUDA_R_8I, k, &beta, c, CUDA_R_32I, n, CUDA_R_32I, algo));
+  });
+#else
+  PADDLE_THROW(platform::errors::Unimplemented(
+      "The INT8 GEMM is not supported on cuda <= 7.5"));
+#endif  // CUDA_VERSION >= 8000
+}
+
+}  // namespace operators
+}  // namespace paddle
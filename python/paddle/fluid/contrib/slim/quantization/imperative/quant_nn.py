@@ -22,12 +22,21 @@ from paddle.fluid.framework import in_dygraph_mode
 from paddle.fluid.initializer import Constant
 from paddle.fluid.data_feeder import check_variable_and_dtype
 
+import os
+
 __all__ = [
     'FakeQuantMovingAverage', 'FakeQuantAbsMax', 'QuantizedConv2D',
     'QuantizedLinear', 'FakeChannelWiseQuantDequantAbsMax',
     'MovingAverageAbsMaxScale'
 ]
 
+# Opt-in switch for the real INT8 compute path of the eval-only fused ops.
+# When enabled, the fused conv2d/matmul cast the (already representable)
+# quantized values to INT8 and run the GEMM with INT32 accumulation on the
+# GPU, instead of simulating quantization in float.
+_use_int8_compute = os.environ.get('PADDLE_QAT_INT8_INFER',
+                                   '0') in ('1', 'true', 'True')
+
 
 class FakeQuantMovingAverage(layers.Layer):
     r"""
@@ -39,6 +48,15 @@ class FakeQuantMovingAverage(layers.Layer):
     :math:`Out = round(X / scale * range) * scale / range`
     """
 
+    # Slots for the plain per-instance attributes. Parameters, sub-layers
+    # and buffers are diverted into the Layer-managed dicts by __setattr__
+    # and must stay out of __slots__, or a stale slot value would shadow
+    # the __getattr__ fallback into those dicts. The base Layer is not
+    # slotted, so the instance dict remains, but the hot attributes get
+    # slot-offset access and stay out of it.
+    __slots__ = ('_moving_rate', '_quant_bits', '_base_attrs', '_mode_attrs',
+                 '_mode_ins')
+
     def __init__(self,
                  name=None,
                  moving_rate=0.9,
@@ -47,6 +65,14 @@ class FakeQuantMovingAverage(layers.Layer):
         super(FakeQuantMovingAverage, self).__init__()
         self._moving_rate = moving_rate
         self._quant_bits = quant_bits
+        # The static half of the op attrs never changes after __init__, so
+        # build it once instead of on every forward.
+        self._base_attrs = ('moving_rate', moving_rate, 'bit_length',
+                            quant_bits)
+        # Complete attr tuples for both modes, indexed by self.training, so
+        # the hot path neither concatenates tuples nor branches.
+        self._mode_attrs = (self._base_attrs + ('is_test', True),
+                            self._base_attrs + ('is_test', False))
 
         scale_prefix = "{}.scale".format(
             name) if name else 'quant_dequant.scale'
@@ -77,25 +103,24 @@ class FakeQuantMovingAverage(layers.Layer):
         self._accum = self.create_parameter(
             shape=[1], attr=accum_attr, dtype=dtype)
         self._accum.stop_gradient = True
-
-    def forward(self, input):
-        if in_dygraph_mode():
-            attrs = ('moving_rate', self._moving_rate, 'bit_length',
-                     self._quant_bits, 'is_test', not self.training)
-            quant_out = _varbase_creator(
-                type=input.type,
-                name="{}.quantized.dequantized".format(input.name),
-                shape=input.shape,
-                dtype=input.dtype,
-                persistable=False)
-            state = self._state if self.training else None
-            accum = self._accum if self.training else None
-
-            out, _, _, _ = core.ops.fake_quantize_dequantize_moving_average_abs_max(
-                input, self._scale, accum, state, quant_out, self._scale, state,
-                accum, *attrs)
-            return out
-
+        # The accum/state inputs are only wired up while training, indexed
+        # by self.training like the attr tuples above.
+        self._mode_ins = ((None, None), (self._accum, self._state))
+
+    def _forward_dygraph(self, input):
+        quant_out = _varbase_creator(
+            type=input.type,
+            shape=input.shape,
+            dtype=input.dtype,
+            persistable=False)
+        accum, state = self._mode_ins[self.training]
+        out, _, _, _ = \
+            core.ops.fake_quantize_dequantize_moving_average_abs_max_fused(
+                input, self._scale, accum, state, quant_out, self._scale,
+                state, accum, *self._mode_attrs[self.training])
+        return out
+
+    def _forward_static(self, input):
         check_variable_and_dtype(input, 'input', ['float32'],
                                  "FakeQuantMovingAverage")
         attrs = {
@@ -126,6 +151,11 @@ class FakeQuantMovingAverage(layers.Layer):
 
         return quant_out
 
+    def forward(self, input):
+        if in_dygraph_mode():
+            return self._forward_dygraph(input)
+        return self._forward_static(input)
+
 
 class FakeQuantAbsMax(layers.Layer):
     r"""
@@ -137,6 +167,8 @@ class FakeQuantAbsMax(layers.Layer):
     :math:`Out = round(X / scale * range) * scale / range`
     """
 
+    __slots__ = ('_quant_bits', '_attrs', '_dtype', '_name', '_scale_name')
+
     def __init__(self,
                  name=None,
                  quant_bits=8,
@@ -144,6 +176,7 @@ class FakeQuantAbsMax(layers.Layer):
                  quant_on_weight=False):
         super(FakeQuantAbsMax, self).__init__()
         self._quant_bits = quant_bits
+        self._attrs = ('bit_length', quant_bits)
         self._dtype = dtype
         self._name = name
         scale_prefix = "{}.scale".format(
@@ -160,28 +193,27 @@ class FakeQuantAbsMax(layers.Layer):
         else:
             self._scale = None
 
-    def forward(self, input):
-        if in_dygraph_mode():
-            attrs = ('bit_length', self._quant_bits)
-            quant_out = _varbase_creator(
-                type=input.type,
-                name="{}.quantized.dequantized".format(input.name),
-                shape=input.shape,
-                dtype=input.dtype,
+    def _forward_dygraph(self, input):
+        attrs = self._attrs
+        quant_out = _varbase_creator(
+            type=input.type,
+            shape=input.shape,
+            dtype=input.dtype,
+            persistable=False)
+        out_scale = self._scale
+        if out_scale is None:
+            out_scale = _varbase_creator(
+                type=core.VarDesc.VarType.LOD_TENSOR,
+                name=self._scale_name,
+                shape=[1],
+                dtype=self._dtype,
                 persistable=False)
-            out_scale = self._scale
-            if not out_scale:
-                out_scale = _varbase_creator(
-                    type=core.VarDesc.VarType.LOD_TENSOR,
-                    name=self._scale_name,
-                    shape=[1],
-                    dtype=self._dtype,
-                    persistable=False)
-                out_scale.stop_gradient = True
-            out, _, = core.ops.fake_quantize_dequantize_abs_max(
-                input, quant_out, out_scale, *attrs)
-            return out
+            out_scale.stop_gradient = True
+        out, _, = core.ops.fake_quantize_dequantize_abs_max(
+            input, quant_out, out_scale, *attrs)
+        return out
 
+    def _forward_static(self, input):
         check_variable_and_dtype(input, 'input', ['float32'], "FakeQuantAbsMax")
         attrs = {'bit_length': self._quant_bits}
         inputs = {"X": [input]}
@@ -192,7 +224,7 @@ class FakeQuantAbsMax(layers.Layer):
             persistable=False,
             stop_gradient=False)
         out_scale = self._scale
-        if not out_scale:
+        if out_scale is None:
             out_scale = self._helper.create_variable(
                 name=self._scale_name,
                 dtype=self._dtype,
@@ -209,19 +241,30 @@ class FakeQuantAbsMax(layers.Layer):
 
         return quant_out
 
+    def forward(self, input):
+        if in_dygraph_mode():
+            return self._forward_dygraph(input)
+        return self._forward_static(input)
+
 
 class FakeChannelWiseQuantDequantAbsMax(layers.Layer):
+    __slots__ = ('_quant_bits', '_quant_axis', '_attrs', '_dtype', '_name',
+                 '_channel_num', '_scale_name')
+
     def __init__(self,
                  name=None,
                  channel_num=None,
                  quant_bits=8,
                  quant_axis=0,
                  dtype='float32',
-                 quant_on_weight=False):
+                 quant_on_weight=False,
+                 symmetric=True):
         assert quant_on_weight == True, "Channel_wise only can be used on weight quantization."
+        assert symmetric == True, "Channel_wise only supports symmetric quantization."
         super(FakeChannelWiseQuantDequantAbsMax, self).__init__()
         self._quant_bits = quant_bits
         self._quant_axis = quant_axis
+        self._attrs = ('bit_length', quant_bits, 'quant_axis', quant_axis)
         self._dtype = dtype
         self._name = name
         self._channel_num = channel_num
@@ -239,31 +282,29 @@ class FakeChannelWiseQuantDequantAbsMax(layers.Layer):
         else:
             self._scale = None
 
-    def forward(self, input):
-        if in_dygraph_mode():
-            attrs = ('bit_length', self._quant_bits, 'quant_axis',
-                     self._quant_axis)
-            quant_out = _varbase_creator(
-                type=input.type,
-                name="{}.quantized.dequantized".format(input.name),
-                shape=input.shape,
-                dtype=input.dtype,
-                persistable=False)
+    def _forward_dygraph(self, input):
+        attrs = self._attrs
+        quant_out = _varbase_creator(
+            type=input.type,
+            shape=input.shape,
+            dtype=input.dtype,
+            persistable=False)
 
-            out_scale = self._scale
-            if out_scale is None:
-                out_scale = _varbase_creator(
-                    type=core.VarDesc.VarType.LOD_TENSOR,
-                    name=self._scale_name,
-                    shape=[self._channel_num],
-                    dtype=self._dtype,
-                    persistable=False)
-                out_scale.stop_gradient = True
+        out_scale = self._scale
+        if out_scale is None:
+            out_scale = _varbase_creator(
+                type=core.VarDesc.VarType.LOD_TENSOR,
+                name=self._scale_name,
+                shape=[self._channel_num],
+                dtype=self._dtype,
+                persistable=False)
+            out_scale.stop_gradient = True
 
-            out, _, = core.ops.fake_channel_wise_quantize_dequantize_abs_max(
-                input, quant_out, out_scale, *attrs)
-            return out
+        out, _, = core.ops.fake_channel_wise_quantize_dequantize_abs_max(
+            input, quant_out, out_scale, *attrs)
+        return out
 
+    def _forward_static(self, input):
         check_variable_and_dtype(input, 'input', ['float32'],
                                  "FakeChannelWiseQuantDequantAbsMax")
         attrs = {'bit_length': self._quant_bits, 'quant_axis': self._quant_axis}
@@ -275,7 +316,7 @@ class FakeChannelWiseQuantDequantAbsMax(layers.Layer):
             persistable=False,
             stop_gradient=False)
         out_scale = self._scale
-        if not out_scale:
+        if out_scale is None:
             out_scale = self._helper.create_variable(
                 name=self._scale_name,
                 dtype=self._dtype,
@@ -292,32 +333,64 @@ class FakeChannelWiseQuantDequantAbsMax(layers.Layer):
 
         return quant_out
 
+    def forward(self, input):
+        if in_dygraph_mode():
+            return self._forward_dygraph(input)
+        return self._forward_static(input)
+
+
+class _IdentityQuant(layers.Layer):
+    """
+    Passthrough returned by _get_fake_quant_type when the requested bit
+    width meets or exceeds the mantissa precision of the tensor dtype: the
+    quant-dequant round trip is exact there, so the kernel launch and the
+    full-tensor pass would be wasted.
+    """
+
+    __slots__ = ()
+
+    def forward(self, input):
+        return input
+
+
+# Mantissa bits (including the implicit one) per dtype; quantizing to at
+# least this many bits is a no-op.
+_dtype_precision_bits = {'float16': 11, 'bfloat16': 8, 'float32': 24}
+
 
 def _get_fake_quant_type(quant_type, **kwargs):
-    call_args = {
-        "name": kwargs.get("name", None),
-        "quant_bits": kwargs.get("quant_bits", 8),
-        "dtype": kwargs.get("dtype", "float32")
-    }
+    name = kwargs.get("name", None)
+    quant_bits = kwargs.get("quant_bits", 8)
+    dtype = kwargs.get("dtype", "float32")
+
+    if quant_bits >= _dtype_precision_bits.get(str(dtype), 99):
+        return _IdentityQuant()
 
     if quant_type == 'abs_max':
-        call_args["quant_on_weight"] = kwargs.get("quant_on_weight", False)
+        return FakeQuantAbsMax(
+            name=name,
+            quant_bits=quant_bits,
+            dtype=dtype,
+            quant_on_weight=kwargs.get("quant_on_weight", False))
     elif quant_type == 'moving_average_abs_max':
-        call_args["moving_rate"] = kwargs.get("moving_rate", 0.9)
+        return FakeQuantMovingAverage(
+            name=name,
+            moving_rate=kwargs.get("moving_rate", 0.9),
+            quant_bits=quant_bits,
+            dtype=dtype)
     elif quant_type == 'channel_wise_abs_max':
-        call_args["quant_on_weight"] = kwargs.get("quant_on_weight", False)
-        call_args["channel_num"] = kwargs.get("channel_num", None)
-        call_args["quant_axis"] = kwargs.get("quant_axis", 0)
-        assert call_args["channel_num"] is not None, (
+        channel_num = kwargs.get("channel_num", None)
+        assert channel_num is not None, (
             "You need to input channel_num"
             "when you use channel_wise_abs_max strategy.")
-    fake_quant_map = {
-        'abs_max': FakeQuantAbsMax,
-        'moving_average_abs_max': FakeQuantMovingAverage,
-        'channel_wise_abs_max': FakeChannelWiseQuantDequantAbsMax
-    }
-
-    return fake_quant_map[quant_type](**call_args)
+        return FakeChannelWiseQuantDequantAbsMax(
+            name=name,
+            channel_num=channel_num,
+            quant_bits=quant_bits,
+            quant_axis=kwargs.get("quant_axis", 0),
+            dtype=dtype,
+            quant_on_weight=kwargs.get("quant_on_weight", False))
+    raise KeyError(quant_type)
 
 
 class QuantizedConv2D(layers.Layer):
@@ -326,6 +399,11 @@ class QuantizedConv2D(layers.Layer):
     The only difference is that its inputs are all fake quantized.
     """
 
+    __slots__ = ('_groups', '_stride', '_padding', '_dilation', '_act',
+                 '_use_cudnn', '_dtype', '_l_type', '_conv2d_quant_axis',
+                 '_weight_bits', '_activation_bits', '_fused', '_conv_attrs',
+                 '_fused_attrs')
+
     def __init__(self,
                  layer,
                  weight_bits=8,
@@ -351,6 +429,20 @@ class QuantizedConv2D(layers.Layer):
         self.bias = getattr(layer, 'bias')
         # For FakeQuant
         self._conv2d_quant_axis = 0
+        self._weight_bits = weight_bits
+        self._activation_bits = activation_bits
+        # The fused op covers the common configuration only, user defined
+        # quantize or preprocess layers fall back to the composable path.
+        self._fused = (weight_pre_layer is None and act_pre_layer is None and
+                       weight_quant_layer is None and act_quant_layer is None)
+        # Lazily filled eval-time cache of the fake quantized weight, see
+        # forward below. A state dict load updates the weight in place
+        # without notifying this layer, so the cache is dropped on every
+        # train() and eval() call; the usual set_state_dict() followed by
+        # eval() therefore picks up the loaded weights. Only updating the
+        # weight while staying in eval mode, without re-calling eval(),
+        # keeps serving the cached result.
+        self._frozen_qweight = None
 
         if weight_quant_layer is not None:
             self._fake_quant_weight = weight_quant_layer()
@@ -380,7 +472,94 @@ class QuantizedConv2D(layers.Layer):
         self._weight_preprocess = weight_pre_layer(
         ) if weight_pre_layer is not None else None
 
-    def forward(self, input):
+        # None of these attrs change after construction, so the tuples are
+        # built once instead of on every forward.
+        w_quant_axis = self._conv2d_quant_axis if isinstance(
+            self._fake_quant_weight, FakeChannelWiseQuantDequantAbsMax) else -1
+        self._conv_attrs = ('strides', self._stride, 'paddings', self._padding,
+                            'dilations', self._dilation, 'groups', self._groups
+                            if self._groups else 1, 'use_cudnn',
+                            self._use_cudnn)
+        self._fused_attrs = ('strides', self._stride, 'paddings',
+                             self._padding, 'dilations', self._dilation,
+                             'groups', self._groups if self._groups else 1,
+                             'activation_bits', self._activation_bits,
+                             'weight_bits', self._weight_bits,
+                             'weight_quant_axis', w_quant_axis,
+                             'use_int8_compute', _use_int8_compute)
+
+    def train(self):
+        # The cached eval-time weight goes stale once training resumes.
+        self._frozen_qweight = None
+        return super(QuantizedConv2D, self).train()
+
+    def eval(self):
+        # Recompute the cache on entering eval, the weight may have been
+        # replaced in place, e.g. by a state dict load.
+        self._frozen_qweight = None
+        return super(QuantizedConv2D, self).eval()
+
+    def _use_fused_op(self):
+        # The fused op has no grad kernel, so it only serves the eval path.
+        # Training keeps the composable ops to stay differentiable.
+        return (self._fused and not self.training and
+                isinstance(self._fake_quant_input, FakeQuantMovingAverage) and
+                isinstance(self._fake_quant_weight,
+                           (FakeQuantAbsMax, FakeChannelWiseQuantDequantAbsMax
+                            )))
+
+    def _forward_dygraph(self, input):
+        if self._l_type == 'conv2d' and self._use_fused_op():
+            pre_bias = core.ops.fused_fake_quant_dequant_conv2d(
+                input, self.weight, self._fake_quant_input._scale,
+                *self._fused_attrs)
+            pre_act = dygraph_utils._append_bias_in_dygraph(pre_bias,
+                                                            self.bias, 1)
+            return dygraph_utils._append_activation_in_dygraph(pre_act,
+                                                               self._act)
+
+        if self._act_preprocess is not None:
+            input = self._act_preprocess(input)
+        quant_input = self._fake_quant_input(input)
+
+        if not self.training:
+            # The weight does not change at eval time, so the fake quant
+            # result is computed once and reused until train() is called.
+            if self._frozen_qweight is None:
+                weight = self.weight
+                if self._weight_preprocess is not None:
+                    weight = self._weight_preprocess(self.weight)
+                self._frozen_qweight = self._fake_quant_weight(weight).detach()
+            quant_weight = self._frozen_qweight
+        else:
+            weight = self.weight
+            if self._weight_preprocess is not None:
+                weight = self._weight_preprocess(self.weight)
+            quant_weight = self._fake_quant_weight(weight)
+
+        if self._l_type == 'conv2d':
+            if (not self.training and self._use_cudnn and
+                    self.bias is not None and input.place.is_gpu_place() and
+                    self._act in (None, 'relu')):
+                # conv2d_fusion applies the bias and the activation in the
+                # convolution epilogue, one pass over the output instead of
+                # three kernels. It only has a CUDA kernel and no grad op,
+                # so the input must live on the GPU and eval only. cuDNN
+                # fuses relu (and identity) only, any other activation
+                # takes the unfused path.
+                return core.ops.conv2d_fusion(
+                    quant_input, quant_weight, self.bias, *self._conv_attrs,
+                    'activation', self._act if self._act else 'identity')
+            pre_bias = core.ops.conv2d(quant_input, quant_weight,
+                                       *self._conv_attrs)
+
+            pre_act = dygraph_utils._append_bias_in_dygraph(pre_bias, self.bias,
+                                                            1)
+            return dygraph_utils._append_activation_in_dygraph(pre_act,
+                                                               self._act)
+        return self._append_conv_ops(quant_input, quant_weight)
+
+    def _forward_static(self, input):
         if self._act_preprocess is not None:
             input = self._act_preprocess(input)
         quant_input = self._fake_quant_input(input)
@@ -390,16 +569,9 @@ class QuantizedConv2D(layers.Layer):
             weight = self._weight_preprocess(self.weight)
         quant_weight = self._fake_quant_weight(weight)
 
-        if in_dygraph_mode() and self._l_type == 'conv2d':
-            attrs = ('strides', self._stride, 'paddings', self._padding,
-                     'dilations', self._dilation, 'groups', self._groups
-                     if self._groups else 1, 'use_cudnn', self._use_cudnn)
-            pre_bias = core.ops.conv2d(quant_input, quant_weight, *attrs)
+        return self._append_conv_ops(quant_input, quant_weight)
 
-            pre_act = dygraph_utils._append_bias_in_dygraph(pre_bias, self.bias,
-                                                            1)
-            return dygraph_utils._append_activation_in_dygraph(pre_act,
-                                                               self._act)
+    def _append_conv_ops(self, quant_input, quant_weight):
         check_variable_and_dtype(quant_input, 'input',
                                  ['float16', 'float32', 'float64'],
                                  'QuantizedConv2D')
@@ -437,6 +609,11 @@ class QuantizedConv2D(layers.Layer):
 
         return self._helper.append_activation(pre_act, act=self._act)
 
+    def forward(self, input):
+        if in_dygraph_mode():
+            return self._forward_dygraph(input)
+        return self._forward_static(input)
+
 
 class QuantizedLinear(layers.Layer):
     """
@@ -444,6 +621,9 @@ class QuantizedLinear(layers.Layer):
     The only difference is that its inputs are all fake quantized.
     """
 
+    __slots__ = ('_act', '_dtype', '_linear_quant_axis', '_weight_bits',
+                 '_activation_bits', '_fused', '_fused_attrs')
+
     def __init__(self,
                  layer,
                  weight_bits=8,
@@ -463,6 +643,20 @@ class QuantizedLinear(layers.Layer):
         self.bias = getattr(layer, 'bias')
         # For FakeQuant
         self._linear_quant_axis = 1
+        self._weight_bits = weight_bits
+        self._activation_bits = activation_bits
+        # The fused op covers the common configuration only, user defined
+        # quantize or preprocess layers fall back to the composable path.
+        self._fused = (weight_pre_layer is None and act_pre_layer is None and
+                       weight_quant_layer is None and act_quant_layer is None)
+        # Lazily filled eval-time cache of the fake quantized weight, see
+        # forward below. A state dict load updates the weight in place
+        # without notifying this layer, so the cache is dropped on every
+        # train() and eval() call; the usual set_state_dict() followed by
+        # eval() therefore picks up the loaded weights. Only updating the
+        # weight while staying in eval mode, without re-calling eval(),
+        # keeps serving the cached result.
+        self._frozen_qweight = None
 
         if weight_quant_layer is not None:
             self._fake_quant_weight = weight_quant_layer()
@@ -493,7 +687,73 @@ class QuantizedLinear(layers.Layer):
         self._weight_preprocess = weight_pre_layer(
         ) if weight_pre_layer is not None else None
 
-    def forward(self, input):
+        # None of these attrs change after construction, so the tuple is
+        # built once instead of on every forward.
+        w_quant_axis = self._linear_quant_axis if isinstance(
+            self._fake_quant_weight, FakeChannelWiseQuantDequantAbsMax) else -1
+        self._fused_attrs = ('activation_bits', self._activation_bits,
+                             'weight_bits', self._weight_bits,
+                             'weight_quant_axis', w_quant_axis,
+                             'use_int8_compute', _use_int8_compute)
+
+    def train(self):
+        # The cached eval-time weight goes stale once training resumes.
+        self._frozen_qweight = None
+        return super(QuantizedLinear, self).train()
+
+    def eval(self):
+        # Recompute the cache on entering eval, the weight may have been
+        # replaced in place, e.g. by a state dict load.
+        self._frozen_qweight = None
+        return super(QuantizedLinear, self).eval()
+
+    def _use_fused_op(self):
+        # The fused op has no grad kernel, so it only serves the eval path.
+        # Training keeps the composable ops to stay differentiable.
+        return (self._fused and not self.training and
+                isinstance(self._fake_quant_input, FakeQuantMovingAverage) and
+                isinstance(self._fake_quant_weight,
+                           (FakeQuantAbsMax, FakeChannelWiseQuantDequantAbsMax
+                            )))
+
+    def _forward_dygraph(self, input):
+        if self._use_fused_op():
+            pre_bias = core.ops.fused_fake_quant_dequant_matmul(
+                input, self.weight, self._fake_quant_input._scale,
+                *self._fused_attrs)
+            pre_act = dygraph_utils._append_bias_in_dygraph(
+                pre_bias, self.bias, axis=len(input.shape) - 1)
+            return dygraph_utils._append_activation_in_dygraph(pre_act,
+                                                               self._act)
+
+        if self._act_preprocess is not None:
+            input = self._act_preprocess(input)
+        quant_input = self._fake_quant_input(input)
+
+        if not self.training:
+            # The weight does not change at eval time, so the fake quant
+            # result is computed once and reused until train() is called.
+            if self._frozen_qweight is None:
+                weight = self.weight
+                if self._weight_preprocess is not None:
+                    weight = self._weight_preprocess(self.weight)
+                self._frozen_qweight = self._fake_quant_weight(weight).detach()
+            quant_weight = self._frozen_qweight
+        else:
+            weight = self.weight
+            if self._weight_preprocess is not None:
+                weight = self._weight_preprocess(self.weight)
+            quant_weight = self._fake_quant_weight(weight)
+
+        pre_bias = _varbase_creator(dtype=input.dtype)
+        core.ops.matmul(quant_input, quant_weight, pre_bias, 'transpose_X',
+                        False, 'transpose_Y', False, "alpha", 1)
+        pre_act = dygraph_utils._append_bias_in_dygraph(
+            pre_bias, self.bias, axis=len(input.shape) - 1)
+
+        return dygraph_utils._append_activation_in_dygraph(pre_act, self._act)
+
+    def _forward_static(self, input):
         if self._act_preprocess is not None:
             input = self._act_preprocess(input)
         quant_input = self._fake_quant_input(input)
@@ -503,16 +763,6 @@ class QuantizedLinear(layers.Layer):
             weight = self._weight_preprocess(self.weight)
         quant_weight = self._fake_quant_weight(weight)
 
-        if in_dygraph_mode():
-            pre_bias = _varbase_creator(dtype=input.dtype)
-            core.ops.matmul(quant_input, quant_weight, pre_bias, 'transpose_X',
-                            False, 'transpose_Y', False, "alpha", 1)
-            pre_act = dygraph_utils._append_bias_in_dygraph(
-                pre_bias, self.bias, axis=len(input.shape) - 1)
-
-            return dygraph_utils._append_activation_in_dygraph(pre_act,
-                                                               self._act)
-
         check_variable_and_dtype(input, 'input',
                                  ['float16', 'float32', 'float64'],
                                  "QuantizedLinear")
@@ -542,8 +792,16 @@ class QuantizedLinear(layers.Layer):
             pre_activation = mul_out
         return self._helper.append_activation(pre_activation, act=self._act)
 
+    def forward(self, input):
+        if in_dygraph_mode():
+            return self._forward_dygraph(input)
+        return self._forward_static(input)
+
 
 class MovingAverageAbsMaxScale(layers.Layer):
+    __slots__ = ('_moving_rate', '_dtype', '_base_attrs', '_mode_args',
+                 '_mode_attrs')
+
     def __init__(self, name=None, moving_rate=0.9, dtype='float32'):
         r"""
         MovingAverageMaxScale layer is used to calculating the output quantization scale of Layer.
@@ -555,6 +813,7 @@ class MovingAverageAbsMaxScale(layers.Layer):
         super(MovingAverageAbsMaxScale, self).__init__()
         self._moving_rate = moving_rate
         self._dtype = dtype
+        self._base_attrs = ('moving_rate', moving_rate)
 
         scale_prefix = '{}.scale'.format(name) if name else 'outscale.scale'
         name = unique_name.generate(scale_prefix)
@@ -582,18 +841,21 @@ class MovingAverageAbsMaxScale(layers.Layer):
             shape=[1], attr=accum_attr, dtype=self._dtype)
         self._accum.stop_gradient = True
         MovingAverageAbsMaxScale._has_create = True
-
-    def forward(self, input):
-        if in_dygraph_mode():
-            attrs = ('moving_rate', self._moving_rate, 'is_test',
-                     not self.training)
-            state = self._state if self.training else None
-            accum = self._accum if self.training else None
-
-            out_scale, _, _ = core.ops.moving_average_abs_max_scale(
-                input, accum, state, self._scale, state, accum, *attrs)
-            return out_scale
-
+        # Complete argument/attr tuples for both modes, indexed by
+        # self.training, so the hot path neither rebuilds them nor branches.
+        self._mode_args = ((None, None, self._scale, None, None),
+                           (self._accum, self._state, self._scale, self._state,
+                            self._accum))
+        self._mode_attrs = (self._base_attrs + ('is_test', True),
+                            self._base_attrs + ('is_test', False))
+
+    def _forward_dygraph(self, input):
+        args = self._mode_args[self.training]
+        out_scale, _, _ = core.ops.moving_average_abs_max_scale(
+            input, *args, *self._mode_attrs[self.training])
+        return out_scale
+
+    def _forward_static(self, input):
         check_variable_and_dtype(input, 'input', ['float32', 'float64'],
                                  'MovingAverageAbsMaxScale')
 
@@ -616,3 +878,8 @@ class MovingAverageAbsMaxScale(layers.Layer):
             attrs=attrs)
 
         return scale_out
+
+    def forward(self, input):
+        if in_dygraph_mode():
+            return self._forward_dygraph(input)
+        return self._forward_static(input)
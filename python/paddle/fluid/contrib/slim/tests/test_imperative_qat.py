@@ -158,6 +158,58 @@ class TestImperativeQat(unittest.TestCase):
     QAT = quantization-aware training
     """
 
+    def test_qat_mode_switch(self):
+        np.random.seed(1)
+        # abs_max activation quantization keeps the eval forward on the
+        # composable ops instead of the fused ones, so the cached fake
+        # quantized weight is actually used and checked below.
+        imperative_qat = ImperativeQuantAware(
+            weight_quantize_type='abs_max',
+            activation_quantize_type='abs_max')
+
+        with fluid.dygraph.guard():
+            lenet = ImperativeLenet()
+            imperative_qat.quantize(lenet)
+            adam = AdamOptimizer(
+                learning_rate=0.001, parameter_list=lenet.parameters())
+
+            x_data = np.random.random((2, 1, 28, 28)).astype('float32')
+            img = fluid.dygraph.to_variable(x_data)
+
+            def train_one_step():
+                out = lenet(img)
+                avg_loss = fluid.layers.mean(out)
+                avg_loss.backward()
+                adam.minimize(avg_loss)
+                lenet.clear_gradients()
+
+            lenet.train()
+            train_one_step()
+
+            # In eval mode the moving average scales are frozen and the
+            # fake quantized weights are cached, so repeated forwards
+            # must return bit-identical results.
+            lenet.eval()
+            out_first = lenet(img).numpy()
+            out_second = lenet(img).numpy()
+            self.assertTrue(
+                np.array_equal(out_first, out_second),
+                msg='Eval forwards of the quantized model should be '
+                'deterministic.')
+
+            # Switching back to train must drop the cached weights and
+            # resume the moving average updates, so the eval output
+            # changes after another training step.
+            lenet.train()
+            train_one_step()
+
+            lenet.eval()
+            out_third = lenet(img).numpy()
+            self.assertFalse(
+                np.array_equal(out_first, out_third),
+                msg='Training after eval should refresh the cached '
+                'quantized weights.')
+
     def test_qat_save(self):
         imperative_qat = ImperativeQuantAware(
             weight_quantize_type='abs_max',
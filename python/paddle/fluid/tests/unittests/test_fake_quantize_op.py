@@ -281,6 +281,12 @@ class TestFakeQuantDequantMovingOp(TestMovingOpBase):
         self.check_grad(["X"], "Out", user_defined_grads=gradient)
 
 
+class TestFakeQuantDequantMovingFusedOp(TestFakeQuantDequantMovingOp):
+    def init_type(self):
+        self.op_type = \
+            "fake_quantize_dequantize_moving_average_abs_max_fused"
+
+
 class TestFakeQuantDequantAbsOp(OpTest):
     def setUp(self):
         self.op_type = "fake_quantize_dequantize_abs_max"
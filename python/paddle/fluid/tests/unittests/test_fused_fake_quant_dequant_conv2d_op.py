@@ -0,0 +1,132 @@
+#   Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import unittest
+import numpy as np
+from op_test import OpTest
+
+from test_conv2d_op import conv2d_forward_naive
+
+
+def quantize_dequantize_max_abs(x, scale, quant_bits):
+    bnt = (1 << (quant_bits - 1)) - 1
+    y = np.clip(x, -scale, scale)
+    return np.round(y / scale * bnt) * scale / bnt
+
+
+def quantize_dequantize_filter(x, quant_bits, quant_axis):
+    if quant_axis == -1:
+        return quantize_dequantize_max_abs(x,
+                                           np.max(np.abs(x)), quant_bits)
+    y = x.copy()
+    if quant_axis == 0:
+        for i in range(x.shape[0]):
+            scale = np.max(np.abs(x[i]))
+            y[i] = quantize_dequantize_max_abs(x[i], scale, quant_bits)
+    else:
+        for i in range(x.shape[1]):
+            scale = np.max(np.abs(x[:, i]))
+            y[:, i] = quantize_dequantize_max_abs(x[:, i], scale, quant_bits)
+    return y
+
+
+class TestFusedFakeQuantDequantConv2DOp(OpTest):
+    def setUp(self):
+        self.op_type = "fused_fake_quant_dequant_conv2d"
+        self.data_format = "NCHW"
+        self.dtype = np.float32
+        self.init_group()
+        self.init_quant_axis()
+        self.init_test_case()
+
+        conv2d_param = {
+            'stride': self.stride,
+            'pad': self.pad,
+            'dilation': self.dilations
+        }
+        input = np.random.random(self.input_size).astype(self.dtype)
+        filter = np.random.random(self.filter_size).astype(self.dtype)
+        scale = np.array([np.max(np.abs(input))]).astype(self.dtype)
+
+        quant_input = quantize_dequantize_max_abs(input, scale[0], 8)
+        quant_filter = quantize_dequantize_filter(filter, 8, self.quant_axis)
+        output, _, _, _, _ = conv2d_forward_naive(quant_input, quant_filter,
+                                                  self.groups, conv2d_param)
+
+        self.inputs = {'Input': input, 'Filter': filter, 'InScale': scale}
+        self.attrs = {
+            'strides': self.stride,
+            'paddings': self.pad,
+            'groups': self.groups,
+            'dilations': self.dilations,
+            'data_format': self.data_format,
+            'activation_bits': 8,
+            'weight_bits': 8,
+            'weight_quant_axis': self.quant_axis,
+        }
+        self.outputs = {'Output': output.astype(self.dtype)}
+
+    def init_test_case(self):
+        self.pad = [0, 0]
+        self.stride = [1, 1]
+        self.dilations = [1, 1]
+        self.input_size = [2, 3, 5, 5]  # NCHW
+        f_c = self.input_size[1] // self.groups
+        self.filter_size = [6, f_c, 3, 3]
+
+    def init_group(self):
+        self.groups = 1
+
+    def init_quant_axis(self):
+        self.quant_axis = -1
+
+    def test_check_output(self):
+        self.check_output()
+
+
+class TestFusedFakeQuantDequantConv2DOpChannelWise(
+        TestFusedFakeQuantDequantConv2DOp):
+    def init_quant_axis(self):
+        self.quant_axis = 0
+
+
+class TestFusedFakeQuantDequantConv2DOpWithStridePad(
+        TestFusedFakeQuantDequantConv2DOp):
+    def init_test_case(self):
+        self.pad = [1, 1]
+        self.stride = [2, 2]
+        self.dilations = [1, 1]
+        self.input_size = [2, 3, 6, 6]  # NCHW
+        f_c = self.input_size[1] // self.groups
+        self.filter_size = [6, f_c, 3, 3]
+
+
+class TestFusedFakeQuantDequantConv2DOpWithGroups(
+        TestFusedFakeQuantDequantConv2DOp):
+    def init_group(self):
+        self.groups = 3
+
+    def init_test_case(self):
+        self.pad = [0, 0]
+        self.stride = [1, 1]
+        self.dilations = [1, 1]
+        self.input_size = [2, 6, 5, 5]  # NCHW
+        f_c = self.input_size[1] // self.groups
+        self.filter_size = [6, f_c, 3, 3]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#   Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import print_function
+
+import unittest
+import numpy as np
+from op_test import OpTest
+
+
+def quantize_dequantize_max_abs(x, scale, quant_bits):
+    bnt = (1 << (quant_bits - 1)) - 1
+    y = np.clip(x, -scale, scale)
+    return np.round(y / scale * bnt) * scale / bnt
+
+
+def channel_wise_quantize_dequantize(x, quant_bits, quant_axis):
+    if quant_axis == -1:
+        return quantize_dequantize_max_abs(x,
+                                           np.max(np.abs(x)), quant_bits)
+    y = x.copy()
+    if quant_axis == 0:
+        for i in range(x.shape[0]):
+            scale = np.max(np.abs(x[i]))
+            y[i] = quantize_dequantize_max_abs(x[i], scale, quant_bits)
+    else:
+        for i in range(x.shape[1]):
+            scale = np.max(np.abs(x[:, i]))
+            y[:, i] = quantize_dequantize_max_abs(x[:, i], scale, quant_bits)
+    return y
+
+
+class TestFusedFakeQuantDequantMatmulOp(OpTest):
+    def setUp(self):
+        self.op_type = "fused_fake_quant_dequant_matmul"
+        self.init_test_case()
+
+        x = np.random.random(self.x_shape).astype("float32")
+        y = np.random.random(self.y_shape).astype("float32")
+        scale = np.array([np.max(np.abs(x))]).astype("float32")
+
+        quant_x = quantize_dequantize_max_abs(x, scale[0], 8)
+        quant_y = channel_wise_quantize_dequantize(y, 8, self.quant_axis)
+        out = np.matmul(quant_x.reshape(-1, self.y_shape[0]), quant_y)
+        out_shape = list(self.x_shape[:-1]) + [self.y_shape[1]]
+
+        self.inputs = {'X': x, 'Y': y, 'InScale': scale}
+        self.attrs = {
+            'activation_bits': 8,
+            'weight_bits': 8,
+            'weight_quant_axis': self.quant_axis,
+            'use_int8_compute': False,
+        }
+        self.outputs = {'Out': out.reshape(out_shape).astype("float32")}
+
+    def init_test_case(self):
+        self.x_shape = (8, 16)
+        self.y_shape = (16, 10)
+        self.quant_axis = -1
+
+    def test_check_output(self):
+        self.check_output()
+
+
+class TestFusedFakeQuantDequantMatmulOpChannelWise(
+        TestFusedFakeQuantDequantMatmulOp):
+    def init_test_case(self):
+        self.x_shape = (8, 16)
+        self.y_shape = (16, 10)
+        self.quant_axis = 1
+
+
+class TestFusedFakeQuantDequantMatmulOpRank3(
+        TestFusedFakeQuantDequantMatmulOp):
+    def init_test_case(self):
+        self.x_shape = (4, 5, 16)
+        self.y_shape = (16, 10)
+        self.quant_axis = -1
+
+
+if __name__ == "__main__":
+    unittest.main()